@@ -1,5 +1,5 @@
+import json
 import importlib
-import traceback
 import longjrm.load_env as jrm_env
 
 
@@ -29,22 +29,30 @@ class DatabaseConnection(object):
         connection_msg = f"Connected to the {self.database_type} database '{self.database}' at {self.host}{port}"
 
         try:
-            # MongoDB Atlas clusters use mongodb+srv protocol that doesn't support explicit port numbers
-            db_url = f"{self.database_type}://{self.user}:{self.password}@{self.host}{port}/{self.database}"
+            # apply the configured connection timeout in seconds, 0 keeps the driver default
+            timeout = int(jrm_env.config['DATABASE']['DB_TIMEOUT'])
 
             if self.database_type == 'mysql':
                 # db_module is pymysql for mysql database
+                # decode JSON columns in the driver, the same way psycopg2 returns json/jsonb as dict
+                conversions = dict(db_module.converters.conversions)
+                conversions[db_module.FIELD_TYPE.JSON] = json.loads
+                timeout_args = {'connect_timeout': timeout} if timeout > 0 else {}
                 self.conn = db_module.connect(host=self.host,
                                               user=self.user,
                                               password=self.password,
                                               database=self.database,
                                               autocommit=self.autocommit,
-                                              cursorclass=db_module.cursors.DictCursor
+                                              cursorclass=db_module.cursors.DictCursor,
+                                              conv=conversions,
+                                              **timeout_args
                                               )
                 self.logger.info(f"{connection_msg}, connection thread: {self.conn.thread_id()}")
 
             elif self.database_type in ['postgres', 'postgresql']:
                 conn_string = f"host={self.host} dbname={self.database} user={self.user} password={self.password}"
+                if timeout > 0:
+                    conn_string += f" connect_timeout={timeout}"
                 self.conn = db_module.connect(conn_string)
                 self.conn.autocommit = self.autocommit
                 self.logger.info(f"{connection_msg}, connection status: {self.conn.status}")
@@ -53,7 +61,11 @@ class DatabaseConnection(object):
                 # Note:
                 # 1. Atlas MongoDB cluster has to be connected through connection URL
                 # 2. When MongoClient instance is created, connection pooling is handled automatically
-                self.conn = db_module.MongoClient(db_url, maxPoolSize=int(jrm_env.config['POOL']['MAX_CONN_POOL_SIZE']))
+                # MongoDB Atlas clusters use mongodb+srv protocol that doesn't support explicit port numbers
+                db_url = f"{self.database_type}://{self.user}:{self.password}@{self.host}{port}/{self.database}"
+                timeout_args = {'connectTimeoutMS': timeout * 1000} if timeout > 0 else {}
+                self.conn = db_module.MongoClient(db_url, maxPoolSize=int(jrm_env.config['POOL']['MAX_CONN_POOL_SIZE']),
+                                                  **timeout_args)
                 # An immediate connection can be forced by checking server function
                 # self.conn.admin.command('ismaster')
                 self.logger.info(f"{connection_msg}")
@@ -64,8 +76,7 @@ class DatabaseConnection(object):
             return self.conn
 
         except Exception as e:
-            self.logger.error(f"{connection_error_msg}: {e}")
-            self.logger.error(traceback.format_exc())
+            self.logger.error(f"{connection_error_msg}: {e}", exc_info=True)
             raise JrmConnectionError(e.args)
 
     def get_client(self):
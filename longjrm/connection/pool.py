@@ -11,6 +11,11 @@ class Pools(object):
 
     def start_pool(self, database_name):
 
+        if database_name in self.pools:
+            # reuse the started pool instead of opening a new set of connections
+            self.logger.info(f"Connection pool for '{database_name}' is already started")
+            return
+
         try:
             dbinfo = jrm_env.dbinfos[database_name]
             database_type = dbinfo['type']
@@ -36,7 +41,7 @@ class Pools(object):
             self.logger.error(f"Invalid database type: {dbinfo.get('type')}")
             raise ValueError("Invalid database type")
 
-        self.logger.info(f"Got connection from pool for {dbinfo.get('type')} '{database_name}'")
+        self.logger.info("Got connection from pool for %s '%s'", dbinfo.get('type'), database_name)
         return {"conn": conn, "database_type": dbinfo['type'], "database_name": database_name,
                 "db_lib": db_lib}
 
@@ -46,7 +51,7 @@ class Pools(object):
         if client['database_type'] not in ['mongodb', 'mongodb+srv']:
             # return the connection to the pool
             client['conn'].close()
-            self.logger.info(f"Released connection to {client['database_type']} '{client['database_name']}'")
+            self.logger.info("Released connection to %s '%s'", client['database_type'], client['database_name'])
 
     def close_connection(self, conn):
         # close connection in connection pool
@@ -72,6 +77,7 @@ class GenericConnectionPool(ConnectionPool):
         db_connection = DatabaseConnection(dbinfo)
         pool = PooledDB(
             creator=db_connection.connect,
+            mincached=int(jrm_env.config['POOL']['MIN_CONN_POOL_SIZE']),  # idle connections opened at startup
             maxconnections=int(jrm_env.config['POOL']['MAX_CONN_POOL_SIZE']),  # maximum number of connections allowed
         )
         return pool
@@ -87,19 +93,23 @@ class MongoConnectionPool(ConnectionPool):
 
 
 class PoolFactory:
+    # ConnectionPool class by database type
+    # Note:
+    #   all the database libraries that support DB-API 2 should work with the generic pool,
+    #   only mysql and postgres are initially tested at this point
+    #   - MG Feb 10, 2024
+    pool_classes = {
+        'mongodb': MongoConnectionPool,
+        'mongodb+srv': MongoConnectionPool,
+        'mysql': GenericConnectionPool,
+        'postgres': GenericConnectionPool,
+        'postgresql': GenericConnectionPool
+    }
+
     # Create ConnectionPool class
     @classmethod
     def create_cp_cls(cls, pool_type):
-        if pool_type in ['mongodb', 'mongodb+srv']:
-            return MongoConnectionPool()
-        elif pool_type in ['mysql', 'postgres', 'postgresql']:
-            """
-                Note: 
-                all the database libraries that support DB-API 2 should work here,
-                only above 2 types of database are initially tested at this point
-                - MG Feb 10, 2024 
-            """
-            # generic pool
-            return GenericConnectionPool()
-        else:
+        pool_cls = cls.pool_classes.get(pool_type)
+        if pool_cls is None:
             raise ValueError("Invalid pool type")
+        return pool_cls()
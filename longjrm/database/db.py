@@ -11,9 +11,20 @@ where condition - json data that defines where column and value pairs
 import re
 import json
 import datetime
+from types import MappingProxyType
 import longjrm.load_env as jrm_env
 
 
+# reserved CURRENT SQL keywords, quoted by ` to be distinguished from ordinary string values
+CURRENT_KEYWORDS = ('`CURRENT DATE`', '`CURRENT_DATE`', '`CURRENT TIMESTAMP`', '`CURRENT_TIMESTAMP`')
+CURRENT_KEYWORD_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in CURRENT_KEYWORDS), re.IGNORECASE)
+
+# default data fetch limit, read once from the loaded config. 0 means unlimit
+DATA_FETCH_LIMIT = int(jrm_env.config.get('DATABASE', 'DATA_FETCH_LIMIT'))
+# default select options, read-only so that one instance is shared by all select calls
+DEFAULT_SELECT_OPTIONS = MappingProxyType({"limit": DATA_FETCH_LIMIT, "order_by": ()})
+
+
 class Db:
 
     def __init__(self, client):
@@ -25,6 +36,15 @@ class Db:
             self.placeholder = '%s'  # placeholder for query value
         else:
             self.placeholder = '?'  # temporary placeholder for future database libraries
+        # resolve the dictionary cursor once per connection, so that the data format of return data set
+        # is a list of dictionary like [{"column": value}]
+        self.cursor_kwargs = {}
+        if self.database_type in ['postgres', 'postgresql']:
+            import psycopg2.extras
+            self.cursor_kwargs = {'cursor_factory': psycopg2.extras.DictCursor}
+        elif self.database_type == 'mysql':
+            import pymysql
+            self.cursor_kwargs = {'cursor': pymysql.cursors.DictCursor}
 
     @staticmethod
     def check_current_keyword(string):
@@ -35,9 +55,12 @@ class Db:
                 then that is keyword and return True
         """
 
+        if '`' not in string:
+            # no escaped keyword possible, skip upper-casing and scanning for each keyword
+            return False
+
         upper_string = string.upper()
-        keywords = ['`CURRENT DATE`', '`CURRENT_DATE`', '`CURRENT TIMESTAMP`', '`CURRENT_TIMESTAMP`']
-        for keyword in keywords:
+        for keyword in CURRENT_KEYWORDS:
             if keyword in upper_string and '\\' + keyword not in upper_string:
                 return True
         return False
@@ -53,10 +76,7 @@ class Db:
                 CURRENT DATE, CURRENT_DATE, CURRENT TIMESTAMP, CURRENT_TIMESTAMP
         """
 
-        keywords = ['`CURRENT DATE`', '`CURRENT_DATE`', '`CURRENT TIMESTAMP`', '`CURRENT_TIMESTAMP`']
-        for keyword in keywords:
-            string = Db.case_insensitive_replace(string, keyword, keyword.replace('`', ''))
-        return string
+        return CURRENT_KEYWORD_PATTERN.sub(lambda match: match.group(0).upper().replace('`', ''), string)
 
     @staticmethod
     def datalist_to_dataseq(datalist, bulk_size=0):
@@ -66,41 +86,48 @@ class Db:
 
         dataseq = []
 
-        for i in range(len(datalist)):
+        for row in datalist:
             row_data = []
-            for k in datalist[i].keys():
-                if isinstance(datalist[i][k], dict):
-                    data_value = json.dumps(datalist[i][k], ensure_ascii=False)
-                elif isinstance(datalist[i][k], list):
-                    if len(datalist[i][k]) > 0:
-                        if isinstance(datalist[i][k][0], dict):
-                            data_value = json.dumps(datalist[i][k], ensure_ascii=False)
+            for value in row.values():
+                if value is None or isinstance(value, (int, float)):
+                    # plain values are bound by the driver as they are
+                    data_value = value
+                elif isinstance(value, dict):
+                    data_value = json.dumps(value, ensure_ascii=False)
+                elif isinstance(value, list):
+                    if len(value) > 0:
+                        if isinstance(value[0], dict):
+                            data_value = json.dumps(value, ensure_ascii=False)
                         else:
-                            data_value = '|'.join(datalist[i][k])
+                            data_value = '|'.join(value)
                     else:
                         data_value = '[]'
-                elif isinstance(datalist[i][k], datetime.date):
-                    data_value = str(datalist[i][k])
-                elif isinstance(datalist[i][k], datetime.datetime):
-                    data_value = datetime.datetime.strftime(datalist[i][k], '%Y-%m-%d %H:%M:%S.%f')
-                elif isinstance(datalist[i][k], str):
+                elif isinstance(value, datetime.date):
+                    data_value = str(value)
+                elif isinstance(value, datetime.datetime):
+                    data_value = datetime.datetime.strftime(value, '%Y-%m-%d %H:%M:%S.%f')
+                elif isinstance(value, str):
                     # TO BE REVIEWED: CURRENT keyword may not be supported by the bind function of ibm_db2 anyway
-                    if Db.check_current_keyword(datalist[i][k]):
+                    if Db.check_current_keyword(value):
                         # handle keywords like CURRENT DATE
-                        data_value = Db.unescape_current_keyword(datalist[i][k])
+                        data_value = Db.unescape_current_keyword(value)
                     else:
-                        data_value = datalist[i][k]
+                        data_value = value
                 else:
-                    data_value = datalist[i][k]
+                    data_value = value
 
                 row_data.append(data_value)
 
             dataseq.append(tuple(row_data))
 
-            if i + 1 == len(datalist) or (bulk_size != 0 and divmod(i + 1, bulk_size)[1] == 0):
+            if len(dataseq) == bulk_size:
                 yield tuple(dataseq)
                 dataseq = []
 
+        # remaining rows, or the whole data set when bulk_size is 0
+        if dataseq:
+            yield tuple(dataseq)
+
     @staticmethod
     def simple_condition_parser(condition, param_index, placeholder):
         """
@@ -300,17 +327,14 @@ class Db:
         if columns is None:
             columns = ["*"]
         if options is None:
-            options = {
-                "limit": jrm_env.config.get('DATABASE', 'DATA_FETCH_LIMIT'),
-                "order_by": []
-            }
+            options = DEFAULT_SELECT_OPTIONS
 
         str_column = ', '.join(columns) if isinstance(columns, list) else None
         if not str_column:
             raise ValueError('Invalid columns')
 
         str_where, arr_values = Db.where_parser(where, self.placeholder)
-        str_order = ' order by ' + ', '.join(options['order_by']) if options['order_by'] else ''
+        str_order = ' order by ' + ', '.join(options['order_by']) if options.get('order_by') else ''
         str_limit = '' if not options.get('limit') or options.get('limit') == 0 else ' limit ' + str(options['limit'])
 
         select_query = "select " + str_column + " from " + table + str_where + str_order + str_limit
@@ -330,7 +354,12 @@ class Db:
             if options.get('limit') != 0:
                 select_query['limit'] = options.get('limit')
         else:
-            select_query['limit'] = int(jrm_env.config.get('DATABASE', 'DATA_FETCH_LIMIT'))
+            select_query['limit'] = DATA_FETCH_LIMIT
+
+        if select_query.get('limit', 0) > 0:
+            # fetch the whole limited result in one batch instead of the default 101 docs + getMore round-trips
+            # a negative limit already means a single batch for pymongo
+            select_query['batch_size'] = select_query['limit']
 
         if options and options.get('order_by'):
             select_query['sort'] = {item.split(' ')[0]: -1 if item.split(' ')[1] == 'desc' else 1 for item in options['order_by']}
@@ -340,18 +369,12 @@ class Db:
     def query(self, sql, arr_values=None, collection_name=None):
         # collection_name is used for MongoDb only
         # for MongoDb query, sql will be a dictionary that contains query parameters, we just re-use the name of sql
-        self.logger.debug(f"Query: {sql}")
+        # defer formatting, sql may be a large MongoDB query dict and debug is normally disabled
+        self.logger.debug("Query: %s", sql)
 
         try:
             if self.database_type in ['mysql', 'postgres', 'postgresql']:
-                # TODO: hard code to be improved
-                # define the data format of return data set as a list of dictionary like [{"column": value}]
-                if self.database_type in ['postgres', 'postgresql']:
-                    import psycopg2.extras
-                    cur = self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-                else:
-                    import pymysql
-                    cur = self.conn.cursor(pymysql.cursors.DictCursor)
+                cur = self.conn.cursor(**self.cursor_kwargs)
                 # scan query input values to exclude CURRENT keyword
                 if arr_values:
                     sql, values = Db.inject_current(sql, arr_values, self.placeholder)
@@ -360,16 +383,13 @@ class Db:
                 rows = cur.fetchall()
                 columns = list(rows[0].keys()) if len(rows) > 0 else []
                 cur.close()
-                self.logger.info(f"Query completed successfully with {len(rows)} rows returned")
+                self.logger.info("Query completed successfully with %d rows returned", len(rows))
                 return {"data": rows, "columns": columns, "count": len(rows)}
 
             elif self.database_type in ['mongodb', 'mongodb+srv']:
-                cur = self.conn[collection_name].find(**sql)
-                rows = []
-                for row in cur:
-                    rows.append(row)
+                rows = list(self.conn[collection_name].find(**sql))
                 columns = list(rows[0].keys()) if len(rows) > 0 else []
-                self.logger.info(f"Query completed successfully with {len(rows)} documents returned")
+                self.logger.info("Query completed successfully with %d documents returned", len(rows))
                 return {"data": rows, "columns": columns, "count": len(rows)}
 
             else:
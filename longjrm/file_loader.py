@@ -9,9 +9,19 @@ def load_ini(file):
 
 
 def load_json(file):
-    import json
-    with open(file, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    try:
+        # orjson is optional, it parses the raw bytes and is faster than the standard json module
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson:
+        with open(file, 'rb') as f:
+            config = orjson.loads(f.read())
+    else:
+        import json
+        with open(file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
     return config
 
 
@@ -13,7 +13,9 @@ try:
     # In production environment, suggest setting up those key initial env variables in OS,
     # including JRM_PY_ENV, JRM_PY_ENV_PATH
     if os.getenv('USE_DOTENV') == 'true':
-        dotenv_path = find_dotenv(os.getenv('DOTENV_PATH'))
+        dotenv_file = os.getenv('DOTENV_PATH')
+        # an absolute file path is used as it is, only a relative one is searched upwards by find_dotenv
+        dotenv_path = dotenv_file if os.path.isabs(dotenv_file) else find_dotenv(dotenv_file)
         if os.path.exists(dotenv_path):
             _ = load_dotenv(dotenv_path)
 
@@ -21,8 +23,13 @@ try:
     config_ini = 'config_' + os.getenv('JRM_PY_ENV', 'dev') + '.ini'
     dbinfos_json = 'dbinfos_' + os.getenv('JRM_PY_ENV', 'dev') + '.json'
 
+    # log level is one of debug, info, warning, error and critical, info by default or for any other value
+    log_levels = {'debug': logging.DEBUG, 'info': logging.INFO, 'warning': logging.WARNING,
+                  'error': logging.ERROR, 'critical': logging.CRITICAL}
+    log_level = log_levels.get(os.getenv('LOG_LEVEL', 'info').strip().lower(), logging.INFO)
+
     # JRM environment is loaded as following module level variables
-    logger = Logger(os.getenv('LOG_FILE'), logging.INFO, os.getenv('APP')).getlog()
+    logger = Logger(os.getenv('LOG_FILE'), log_level, os.getenv('APP')).getlog()
     config = load_ini(os.path.join(env_path, config_ini))
     dbinfos = load_json(os.path.join(env_path, dbinfos_json))
     db_lib_map = load_json(os.path.join(env_path, 'db_lib_map.json'))
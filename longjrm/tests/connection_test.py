@@ -17,7 +17,7 @@ try:
     if dbtype != 'mongodb':
         with conn.cursor() as cursor:
             # Read a single record
-            sql = "SELECT * from sample"
+            sql = "SELECT * from sample limit 1"
             cursor.execute(sql)
             result = cursor.fetchone()
             print(result)
@@ -1,7 +1,14 @@
+import reprlib
 from longjrm.connection.pool import Pools
 from longjrm.database.db import Db
 
 
+# cap printed results so large tables don't flood the console
+result_repr = reprlib.Repr()
+result_repr.maxlist = result_repr.maxdict = 3
+result_repr.maxstring = 80
+
+
 database = {'mysql': 'mysql-test',
             'postgres': 'postgres-test',
             'mongodb': 'mongodb-test'
@@ -19,12 +26,12 @@ db = Db(client)
 
 if dbtype == 'mongodb':
     result = db.select(table='Listing', where={'guestCount': 4, 'roomCount': 2})
-    print(result)
+    print(result_repr.repr(result))
 else:
     result1 = db.select(table='sample', columns=['*'], where={'c1': 'a'})
     result2 = db.select(table='sample', columns=['*'], where={'c2': 3})
-    print(result1)
-    print(result2)
+    print(result_repr.repr(result1))
+    print(result_repr.repr(result2))
 
 # cursor = conn.cursor()
 # cursor.execute("SELECT VERSION()")